@@ -1,10 +1,37 @@
+import importlib
+
 from calliope._version import __version__
 
-from calliope import examples, exceptions
-from calliope.core import AttrDict, Model, read_netcdf
+from calliope import exceptions
 from calliope.core.util.logging import set_log_verbosity
 
 
 __title__ = "Calliope"
 __author__ = "Calliope contributors listed in AUTHORS"
 __copyright__ = "Copyright (C) since 2013 Calliope contributors listed in AUTHORS"
+
+__all__ = [
+    "AttrDict",
+    "Model",
+    "examples",
+    "exceptions",
+    "read_netcdf",
+    "set_log_verbosity",
+]
+
+# The modelling stack (xarray, Pyomo, ...) is only imported on first use of
+# these, so that e.g. the command-line interface starts quickly
+_LAZY_MODULES = ["backend", "core", "examples", "postprocess", "preprocess", "time"]
+_LAZY_ATTRS = ["AttrDict", "Model", "read_netcdf"]
+
+
+def __getattr__(name):
+    if name in _LAZY_MODULES:
+        return importlib.import_module("calliope." + name)
+    elif name in _LAZY_ATTRS:
+        return getattr(importlib.import_module("calliope.core"), name)
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_MODULES) | set(_LAZY_ATTRS))
@@ -9,7 +9,14 @@ Capacity constraints for technologies (output, resource, area, and storage).
 
 """
 
+import collections
+import math
+
 import pyomo.core as po  # pylint: disable=import-error
+from pyomo.core import value as _value  # pylint: disable=import-error
+from pyomo.core.expr.numvalue import (  # pylint: disable=import-error
+    native_numeric_types,
+)
 import numpy as np
 
 from calliope.backend.pyomo.util import get_param, split_comma_list
@@ -17,6 +24,9 @@ from calliope import exceptions
 
 ORDER = 10  # order in which to invoke constraints relative to other constraint files
 
+# Forms a capacity constraint can take, decided ahead of building the constraints
+NO_CONSTRAINT, EQUALS_CONSTRAINT, RANGE_CONSTRAINT, INFINITE_EQUALS = 0, 1, 2, 3
+
 
 def load_constraints(backend_model):
     sets = backend_model.__calliope_model_data["sets"]
@@ -91,43 +101,125 @@ def load_constraints(backend_model):
             )
 
         if "techs_energy_capacity_systemwide_constraint" in sets:
+            backend_model.__calliope_loc_techs_by_tech = _get_loc_techs_by_tech(
+                backend_model
+            )
             backend_model.energy_capacity_systemwide_constraint = po.Constraint(
                 backend_model.techs_energy_capacity_systemwide_constraint,
                 rule=energy_capacity_systemwide_constraint_rule,
             )
 
 
-def get_capacity_constraint(
-    backend_model, parameter, loc_tech, _equals=None, _max=None, _min=None, scale=None
-):
-
+def _prefetch_capacity_params(backend_model, parameter):
+    """
+    Read the `_equals`, `_max` and `_min` bounds of `parameter` for all
+    loc_techs of its decision variable into NumPy arrays in a single pass over
+    the model data, and decide from them which form of constraint each loc_tech
+    needs, so that `get_capacity_constraint` does not need to evaluate Pyomo
+    Params. Unset `_equals` values are read as NaN.
+
+    The constraint forms are stored on the backend model, alongside the
+    decision variable and a dictionary mapping each loc_tech to its row in the
+    array of forms.
+    """
+    model_data_dict = backend_model.__calliope_model_data["data"]
+    defaults = backend_model.__calliope_defaults
     decision_variable = getattr(backend_model, parameter)
+    loc_techs = list(decision_variable.index_set())
+    rows = {loc_tech: row for row, loc_tech in enumerate(loc_techs)}
+
+    def _get_values(bound, unset=None):
+        # Start from the default, then fill in values set in the model data
+        values = np.full(
+            len(loc_techs),
+            _unset_to_nan(defaults.get(parameter + bound, None), unset),
+            dtype=float,
+        )
+        for loc_tech, value in model_data_dict.get(parameter + bound, {}).items():
+            if loc_tech in rows:
+                values[rows[loc_tech]] = _unset_to_nan(value, unset)
+        return values
+
+    backend_model.__calliope_capacity_bounds[parameter] = (
+        decision_variable,
+        rows,
+        _classify_bounds(
+            _get_values("_equals", unset=False),
+            _get_values("_max"),
+            _get_values("_min"),
+        ),
+    )
+
+
+def _unset_to_nan(value, unset=None):
+    """
+    Get `value` as a number, with `None` and the `unset` sentinel (e.g. a
+    default of `False`) given as NaN.
+    """
+    return np.nan if value is None or value is unset else value
+
+
+def _classify_bounds(_equals, _max, _min):
+    """
+    Get the form of capacity constraint (`NO_CONSTRAINT`, `EQUALS_CONSTRAINT`
+    or `RANGE_CONSTRAINT`) for each row of the `_equals`, `_max` and `_min`
+    bound arrays. Rows with an infinite `_equals` are given as `INFINITE_EQUALS`.
+    """
+    return np.select(
+        [np.isinf(_equals), ~np.isnan(_equals), (_min == 0) & np.isinf(_max)],
+        [INFINITE_EQUALS, EQUALS_CONSTRAINT, NO_CONSTRAINT],
+        default=RANGE_CONSTRAINT,
+    )
 
-    if not _equals:
+
+def _get_loc_techs_by_tech(backend_model):
+    """
+    Map each technology to its loc_techs. Transmission loc_techs
+    (e.g. `region1::ac_transmission:region2`) are also mapped to the name of
+    the transmission technology (e.g. `ac_transmission`).
+    """
+    loc_techs_by_tech = collections.defaultdict(list)
+    for loc_tech in backend_model.loc_techs:
+        loc_techs_by_tech[loc_tech.split("::")[1]].append(loc_tech)
+    for loc_tech in getattr(backend_model, "loc_techs_transmission", []):
+        loc_techs_by_tech[loc_tech.split("::")[1].split(":")[0]].append(loc_tech)
+
+    return loc_techs_by_tech
+
+
+def get_capacity_constraint(backend_model, parameter, loc_tech, scale=None):
+
+    # Bounds are read for all loc_techs the first time `parameter` is constrained
+    if parameter not in backend_model.__calliope_capacity_bounds:
+        _prefetch_capacity_params(backend_model, parameter)
+    capacity_bounds = backend_model.__calliope_capacity_bounds[parameter]
+    decision_variable, rows, constraint_forms = capacity_bounds
+    constraint_form = constraint_forms[rows[loc_tech]]
+
+    # Scaling by a default of one leaves the bounds unchanged, so is left out of
+    # the expressions. A scale held in a Param is kept, as it can be updated later.
+    if scale.__class__ in native_numeric_types and scale == 1:
+        scale = None
+
+    if constraint_form == INFINITE_EQUALS:
+        e = exceptions.ModelError
+        raise e(
+            "Cannot use inf for {}_equals for loc:tech `{}`".format(parameter, loc_tech)
+        )
+    elif constraint_form == EQUALS_CONSTRAINT:
         _equals = get_param(backend_model, parameter + "_equals", loc_tech)
-    if not _max:
-        _max = get_param(backend_model, parameter + "_max", loc_tech)
-    if not _min:
-        _min = get_param(backend_model, parameter + "_min", loc_tech)
-    if po.value(_equals) is not False and po.value(_equals) is not None:
-        if np.isinf(po.value(_equals)):
-            e = exceptions.ModelError
-            raise e(
-                "Cannot use inf for {}_equals for loc:tech `{}`".format(
-                    parameter, loc_tech
-                )
-            )
         if scale:
             _equals *= scale
         return decision_variable[loc_tech] == _equals
+    elif constraint_form == NO_CONSTRAINT:
+        return po.Constraint.NoConstraint
     else:
-        if po.value(_min) == 0 and np.isinf(po.value(_max)):
-            return po.Constraint.NoConstraint
-        else:
-            if scale:
-                _max *= scale
-                _min *= scale
-            return (_min, decision_variable[loc_tech], _max)
+        _max = get_param(backend_model, parameter + "_max", loc_tech)
+        _min = get_param(backend_model, parameter + "_min", loc_tech)
+        if scale:
+            _max *= scale
+            _min *= scale
+        return (_min, decision_variable[loc_tech], _max)
 
 
 def storage_capacity_constraint_rule(backend_model, loc_tech):
@@ -321,7 +413,7 @@ def resource_area_constraint_rule(backend_model, loc_tech):
         backend_model, "resource_area_per_energy_cap", loc_tech
     )
 
-    if po.value(energy_cap_max) == 0 and not po.value(area_per_energy_cap):
+    if _value(energy_cap_max) == 0 and not _value(area_per_energy_cap):
         # If a technology has no energy_cap here, we force resource_area to zero,
         # so as not to accrue spurious costs
         return backend_model.resource_area[loc_tech] == 0
@@ -370,7 +462,7 @@ def resource_area_capacity_per_loc_constraint_rule(backend_model, loc):
     loc_techs = split_comma_list(model_data_dict["lookup_loc_techs_area"][loc])
 
     return (
-        sum(backend_model.resource_area[loc_tech] for loc_tech in loc_techs)
+        po.quicksum(backend_model.resource_area[loc_tech] for loc_tech in loc_techs)
         <= available_area
     )
 
@@ -429,30 +521,29 @@ def energy_capacity_systemwide_constraint_rule(backend_model, tech):
 
     """
 
+    all_loc_techs = backend_model.__calliope_loc_techs_by_tech[tech]
     if tech in getattr(backend_model, "techs_transmission_names", []):
-        all_loc_techs = [
-            i
-            for i in backend_model.loc_techs_transmission
-            if i.split("::")[1].split(":")[0] == tech
-        ]
         multiplier = 2  # there are always two technologies associated with one link
     else:
-        all_loc_techs = [i for i in backend_model.loc_techs if i.split("::")[1] == tech]
         multiplier = 1
 
     max_systemwide = get_param(backend_model, "energy_cap_max_systemwide", tech)
     equals_systemwide = get_param(backend_model, "energy_cap_equals_systemwide", tech)
+    max_systemwide_val = _value(max_systemwide)
+    equals_systemwide_val = _value(equals_systemwide)
 
-    if np.isinf(po.value(max_systemwide)) and not equals_systemwide:
+    if math.isinf(max_systemwide_val) and not equals_systemwide_val:
         return po.Constraint.NoConstraint
-    elif equals_systemwide and np.isinf(po.value(equals_systemwide)):
+    elif equals_systemwide_val and math.isinf(equals_systemwide_val):
         raise exceptions.ModelError(
             "Cannot use inf for energy_cap_equals_systemwide for tech `{}`".format(tech)
         )
 
-    sum_expr = sum(backend_model.energy_cap[loc_tech] for loc_tech in all_loc_techs)
+    sum_expr = po.quicksum(
+        backend_model.energy_cap[loc_tech] for loc_tech in all_loc_techs
+    )
 
-    if equals_systemwide:
+    if equals_systemwide_val:
         return sum_expr == equals_systemwide * multiplier
     else:
         return sum_expr <= max_systemwide * multiplier
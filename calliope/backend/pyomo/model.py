@@ -73,6 +73,12 @@ def generate_model(model_data):
     backend_model.__calliope_run_config = AttrDict.from_yaml_string(
         model_data.attrs["run_config"]
     )
+    # Cache of `get_param` lookups while this instance of the backend model is
+    # being built
+    backend_model.__calliope_param_cache = {}
+    # Filled with bounds read from model data the first time each decision
+    # variable is given a capacity constraint
+    backend_model.__calliope_capacity_bounds = {}
 
     for k, v in model_data_dict["data"].items():
         _kwargs = {
@@ -107,6 +113,10 @@ def generate_model(model_data):
                 mutable=True,
                 within=po.Reals,
             )
+            # (cost class, weight) pairs, as used when building the objective
+            backend_model.__calliope_objective_cost_class_items = tuple(
+                backend_model.objective_cost_class.items()
+            )
         else:
             setattr(backend_model, "objective_" + option_name, option_val)
 
@@ -168,6 +178,8 @@ def generate_model(model_data):
     )
     load_function(objective_function)(backend_model)
 
+    backend_model.__calliope_param_cache = None
+
     return backend_model
 
 
@@ -21,33 +21,33 @@ def minmax_cost_optimization(backend_model):
     dictionary with a single key:value pair where value == 1. The dictionary provides a weight
     for each cost class of interest: {cost_1: weight_1, cost_2: weight_2, etc.}.
 
-    If unmet_demand is in use, then the calculated cost of unmet_demand is
-    added or subtracted from the total cost in the opposite sense to the
-    objective.
+    If unmet_demand is in use, then the calculated cost of unmet_demand and
+    unused_supply is added or subtracted from the total cost in the opposite
+    sense to the objective.
 
     .. container:: scrolling-wrapper
 
         .. math::
 
             min: z = \\sum_{loc::tech_{cost},k} (cost(loc::tech, cost=cost_{k}) \\times weight_{k}) +
-             \\sum_{loc::carrier,timestep} (unmet\\_demand(loc::carrier, timestep) \\times bigM)
+             \\sum_{loc::carrier,timestep} ((unmet\\_demand(loc::carrier, timestep)
+             - unused\\_supply(loc::carrier, timestep)) \\times timestep\\_weight(timestep) \\times bigM)
 
             max: z = \\sum_{loc::tech_{cost},k} (cost(loc::tech, cost=cost_{k}) \\times weight_{k}) -
-             \\sum_{loc::carrier,timestep} (unmet\\_demand(loc::carrier, timestep) \\times bigM)
+             \\sum_{loc::carrier,timestep} ((unmet\\_demand(loc::carrier, timestep)
+             - unused\\_supply(loc::carrier, timestep)) \\times timestep\\_weight(timestep) \\times bigM)
 
     """
 
     def obj_rule(backend_model):
         if backend_model.__calliope_run_config.get("ensure_feasibility", False):
             unmet_demand = (
-                sum(
-                    (
-                        backend_model.unmet_demand[loc_carrier, timestep]
-                        - backend_model.unused_supply[loc_carrier, timestep]
-                    )
+                po.quicksum(
+                    (unmet - backend_model.unused_supply[loc_carrier, timestep])
                     * backend_model.timestep_weights[timestep]
-                    for loc_carrier in backend_model.loc_carriers
-                    for timestep in backend_model.timesteps
+                    for (loc_carrier, timestep), unmet in (
+                        backend_model.unmet_demand.items()
+                    )
                 )
                 * backend_model.bigM
             )
@@ -56,11 +56,17 @@ def minmax_cost_optimization(backend_model):
         else:
             unmet_demand = 0
 
+        # Each term is a cost variable weighted by a cost class Param, so the sum
+        # is known to be linear. This is what po.sum_product would build, but
+        # weights and costs do not share an index.
         return (
-            sum(
-                backend_model.cost[k, loc_tech] * v
-                for loc_tech in backend_model.loc_techs_cost
-                for k, v in backend_model.objective_cost_class.items()
+            po.quicksum(
+                (
+                    backend_model.cost[k, loc_tech] * v
+                    for k, v in backend_model.__calliope_objective_cost_class_items
+                    for loc_tech in backend_model.loc_techs_cost
+                ),
+                linear=True,
             )
             + unmet_demand
         )
@@ -19,12 +19,15 @@ from calliope import exceptions
 logger = logging.getLogger(__name__)
 
 
-@memoize
 def get_param(backend_model, var, dims):
     """
     Get an input parameter held in a Pyomo object, or held in the defaults
     dictionary if that Pyomo object doesn't exist.
 
+    Lookups without a timestep are cached on the backend model while it is
+    being built, since the same parameter is often requested by several
+    constraints for the same index.
+
     Parameters
     ----------
     backend_model : Pyomo model instance
@@ -32,6 +35,19 @@ def get_param(backend_model, var, dims):
     dims : single value or tuple
 
     """
+    param_cache = backend_model.__calliope_param_cache
+    # Lookups by timestep are rarely repeated, so are not worth caching
+    if param_cache is None or (
+        isinstance(dims, tuple) and isinstance(dims[-1], pd.Timestamp)
+    ):
+        return _get_param(backend_model, var, dims)
+
+    if (var, dims) not in param_cache:
+        param_cache[var, dims] = _get_param(backend_model, var, dims)
+    return param_cache[var, dims]
+
+
+def _get_param(backend_model, var, dims):
     try:
         return getattr(backend_model, var)[dims]
     except AttributeError:  # i.e. parameter doesn't exist at all
@@ -14,16 +14,13 @@ import datetime
 import itertools
 import logging
 import os
-import pstats
 import shutil
 import sys
 import traceback
 
 import click
 
-from calliope import AttrDict, Model, examples, read_netcdf
 from calliope._version import __version__
-from calliope.core.util.generate_runs import generate
 from calliope.core.util.logging import set_log_verbosity
 from calliope.exceptions import BackendError
 
@@ -79,6 +76,7 @@ def format_exceptions(
     try:
         if profile:
             import cProfile
+            import pstats
 
             profile = cProfile.Profile()
             profile.enable()
@@ -178,6 +176,8 @@ def new(path, template, debug):
     example models. The target path must not yet exist. Intermediate
     directories will be created automatically.
     """
+    from calliope import examples
+
     _cli_start(debug, quiet=False)
 
     with format_exceptions(debug):
@@ -185,7 +185,11 @@ def new(path, template, debug):
             template = "national_scale"
         source_path = examples._PATHS[template]
         click.echo("Copying {} template to target directory: {}".format(template, path))
-        shutil.copytree(source_path, path)
+        shutil.copytree(
+            source_path,
+            path,
+            ignore=shutil.ignore_patterns("__pycache__", ".pytest_cache", "*.pyc"),
+        )
 
 
 def _run_setup_model(model_file, scenario, model_format, override_dict):
@@ -194,6 +198,8 @@ def _run_setup_model(model_file, scenario, model_format, override_dict):
     calliope.Model instance.
 
     """
+    from calliope import Model, read_netcdf
+
     # Try to determine model file type if not given explicitly
     if model_format is None:
         if model_file.split(".")[-1] in ["yaml", "yml"]:
@@ -353,6 +359,7 @@ def generate_runs(
     quiet,
     pdb,
 ):
+    from calliope.core.util.generate_runs import generate
 
     _cli_start(debug, quiet)
 
@@ -385,6 +392,7 @@ def generate_runs(
 def generate_scenarios(
     model_file, out_file, overrides, scenario_name_prefix, debug, quiet, pdb
 ):
+    from calliope import AttrDict
 
     _cli_start(debug, quiet)
 
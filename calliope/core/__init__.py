@@ -1,2 +1,20 @@
-from calliope.core.model import Model, read_netcdf
-from calliope.core.attrdict import AttrDict
+import importlib
+
+__all__ = ["AttrDict", "Model", "read_netcdf"]
+
+# Imported on first use, as importing the model also imports the backend
+_LAZY_MODULES = ["attrdict", "io", "model", "util"]
+
+
+def __getattr__(name):
+    if name in _LAZY_MODULES:
+        return importlib.import_module("calliope.core." + name)
+    elif name in ["Model", "read_netcdf"]:
+        return getattr(importlib.import_module("calliope.core.model"), name)
+    elif name == "AttrDict":
+        return importlib.import_module("calliope.core.attrdict").AttrDict
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_MODULES) | set(__all__))
@@ -960,6 +960,23 @@ class TestCapacityConstraints:
             == 0
         )
 
+        # An infinite resource_area_equals is not used, so is not caught, when
+        # energy_cap_max forces resource_area to 0
+        m = build_model(
+            {
+                "techs.test_supply_plus.constraints": {
+                    "resource_area_equals": np.inf,
+                    "energy_cap_max": 0,
+                }
+            },
+            "simple_supply_and_supply_plus,two_hours,investment_costs",
+        )
+        m.run(build_only=True)
+        assert (
+            m._backend_model.resource_area_constraint["0::test_supply_plus"].upper()
+            == 0
+        )
+
     def test_loc_techs_resource_area_per_energy_capacity_constraint(self):
         """
         i for i in sets.loc_techs_area if i in sets.loc_techs_supply_plus
@@ -1051,6 +1068,23 @@ class TestCapacityConstraints:
             * 5
         )
 
+    def test_loc_techs_energy_capacity_constraint_update_scale(self):
+        """
+        Updating energy_cap_scale after the model is built scales the bounds,
+        including for loc_techs which were built with a scale of one
+        """
+        m = build_model(
+            {"locations.0.techs.test_supply_elec.constraints.energy_cap_scale": 5},
+            "simple_supply_and_supply_plus,two_hours,investment_costs",
+        )
+        m.run(build_only=True)
+        constraint = m._backend_model.energy_capacity_constraint
+        upper = constraint["1::test_supply_elec"].upper()
+
+        m.backend.update_param("energy_cap_scale", {"1::test_supply_elec": 2})
+
+        assert constraint["1::test_supply_elec"].upper() == upper * 2
+
     @pytest.mark.filterwarnings("ignore:(?s).*Integer:calliope.exceptions.ModelWarning")
     def test_loc_techs_energy_capacity_milp_constraint(self):
         m = build_model(
@@ -3,6 +3,7 @@ import pytest  # pylint: disable=unused-import
 import pyomo.core as po
 
 from calliope.test.common.util import build_test_model as build_model
+from calliope.backend.pyomo import util
 from calliope.backend.pyomo.util import get_domain, get_param, invalid
 
 
@@ -84,6 +85,39 @@ class TestGetParam:
             )
             get_param(m._backend_model, "random_param", ("1::test_supply_elec"))
 
+    def test_get_param_cached_while_building(self, monkeypatch):
+        """
+        Repeated lookups without a timestep are only made once while a backend
+        model is being built, and are not cached once it is built
+        """
+        m = build_model({}, "simple_supply,two_hours,investment_costs")
+        m.run(build_only=True)
+        assert getattr(m._backend_model, "__calliope_param_cache") is None
+
+        lookups = []
+        _get_param = util._get_param
+
+        def _counted_get_param(backend_model, var, dims):
+            lookups.append((var, dims))
+            return _get_param(backend_model, var, dims)
+
+        monkeypatch.setattr(util, "_get_param", _counted_get_param)
+
+        for _ in range(2):
+            get_param(m._backend_model, "energy_cap_max", ("1::test_supply_elec"))
+        assert len(lookups) == 2
+
+        # As while the model is being built
+        setattr(m._backend_model, "__calliope_param_cache", {})
+        for _ in range(2):
+            get_param(m._backend_model, "energy_cap_max", ("1::test_supply_elec"))
+        assert len(lookups) == 3
+
+        timestep = m._backend_model.timesteps[1]
+        for _ in range(2):
+            get_param(m._backend_model, "resource", ("1::test_demand_elec", timestep))
+        assert len(lookups) == 5
+
 
 class TestGetDomain:
     @pytest.mark.parametrize(
@@ -1,4 +1,6 @@
 import os
+import subprocess
+import sys
 import tempfile
 
 import pytest  # pylint: disable=unused-import
@@ -17,6 +19,57 @@ _MINIMAL_TEST_MODEL = os.path.join(
 
 
 class TestCLI:
+    def test_import_leaves_out_backend(self):
+        # The modelling stack is only imported by the commands which use it
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, calliope.cli; print('pyomo' in sys.modules)",
+            ],
+            stdout=subprocess.PIPE,
+            check=True,
+        )
+        assert result.stdout.decode().strip() == "False"
+
+    def test_import_leaves_out_subpackages_until_used(self):
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, calliope; "
+                "print('calliope.backend' in sys.modules, calliope.backend.__name__)",
+            ],
+            stdout=subprocess.PIPE,
+            check=True,
+        )
+        assert result.stdout.decode().strip() == "False calliope.backend"
+
+    def test_package_namespace(self):
+        # Names imported on first use are still listed and exported
+        for name in ["AttrDict", "Model", "examples", "read_netcdf"]:
+            assert name in dir(calliope)
+            assert name in calliope.__all__
+        for name in ["AttrDict", "Model", "read_netcdf"]:
+            assert name in dir(calliope.core)
+            assert name in calliope.core.__all__
+
+    def test_help_leaves_out_backend(self):
+        code = (
+            "import sys\n"
+            "from calliope.cli import cli\n"
+            "try:\n"
+            "    cli(['--help'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print('pyomo' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], stdout=subprocess.PIPE, check=True
+        )
+        assert "Usage:" in result.stdout.decode()
+        assert result.stdout.decode().splitlines()[-1] == "False"
+
     def test_new(self):
         runner = CliRunner()
         with tempfile.TemporaryDirectory() as tempdir:
@@ -26,6 +79,21 @@ class TestCLI:
             # Assert that `model.yaml` in the target dir exists
             assert os.path.isfile(os.path.join(tempdir, "test", "model.yaml"))
 
+    def test_new_skips_cache_files(self, monkeypatch):
+        runner = CliRunner()
+        with tempfile.TemporaryDirectory() as tempdir:
+            source_path = os.path.join(tempdir, "source")
+            os.makedirs(os.path.join(source_path, "__pycache__"))
+            for filename in ["model.yaml", "script.pyc"]:
+                with open(os.path.join(source_path, filename), "w") as f:
+                    f.write("")
+            monkeypatch.setitem(calliope.examples._PATHS, "national_scale", source_path)
+
+            new_path = os.path.join(tempdir, "test")
+            result = runner.invoke(cli.new, [new_path])
+            assert result.exit_code == 0
+            assert os.listdir(new_path) == ["model.yaml"]
+
     def test_run_from_yaml(self):
         runner = CliRunner()
 